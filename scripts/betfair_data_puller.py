@@ -10,9 +10,10 @@ import credentials
 import pandas as pd
 import datetime
 import runnerbooks_processing
+import data_puller_schema
 import os
 from data_puller_logger import logger
-from data_puller_mysql import con
+from data_puller_mysql import con, insert_skip_duplicates
 from data_puller_es import ep
 
 
@@ -180,7 +181,7 @@ class BetfairDataPuller:
             'Runner Names': runner_names,
         })
         current_runner_names_df = current_runner_names_df.loc[
-            current_runner_names_df['Selection ID'] != 58805.0
+            current_runner_names_df['Selection ID'] != data_puller_schema.DRAW_SELECTION_ID
             ]
         self.runner_names_df = self.runner_names_df.append(current_runner_names_df)
 
@@ -335,10 +336,14 @@ class BetfairDataPuller:
             self.market_info_df.columns = [x.replace(' ', '') for x in self.market_info_df.columns]
             self.results_df.columns = [x.replace(' ', '') for x in self.results_df.columns]
             self.market_data_df.columns = [x.replace(' ', '') for x in self.market_data_df.columns]
-            self.runner_names_df.to_sql('runnerNames', con, if_exists='append', index=False)
-            self.market_info_df.to_sql('marketInfo', con, if_exists='append', index=False)
-            self.results_df.to_sql('results', con, if_exists='append', index=False)
-            self.market_data_df.to_sql('marketData', con, if_exists='append', index=False)
+            self.runner_names_df.to_sql('runnerNames', con, if_exists='append', index=False,
+                                        method=insert_skip_duplicates)
+            self.market_info_df.to_sql('marketInfo', con, if_exists='append', index=False,
+                                       method=insert_skip_duplicates)
+            self.results_df.to_sql('results', con, if_exists='append', index=False,
+                                   method=insert_skip_duplicates)
+            self.market_data_df.to_sql('marketData', con, if_exists='append', index=False,
+                                       method=insert_skip_duplicates)
 
         self.runner_names_df = pd.DataFrame()
         self.market_info_df = pd.DataFrame()
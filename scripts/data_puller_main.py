@@ -7,10 +7,13 @@ Created on Mar 17 2020
 """
 
 import betfair_data_puller
+import data_puller_schema
+from data_puller_mysql import con
 from time import sleep
 import pandas as pd
 from data_puller_logger import logger
 import traceback
+import datetime
 import os
 import sys
 
@@ -29,8 +32,8 @@ market_data_csv = '../data/market_data.csv'
 # ------ CREATE EMPTY CSVs -------
 if not os.path.exists(runner_names_csv):
     pd.DataFrame({
-                'Selection ID': [58805.0],
-                'Runner Names': ['The Draw'],
+                'Selection ID': [float(data_puller_schema.DRAW_SELECTION_ID)],
+                'Runner Names': [data_puller_schema.DRAW_RUNNER_NAME],
             }).to_csv(runner_names_csv, sep=',', index=False)
 
 if not os.path.exists(market_info_csv):
@@ -80,8 +83,21 @@ def main(bdp):
     """
     count = 0
     count_error = 0
+    partitions_check_date = None
     while True:
         try:
+            # Once a UTC day, keeps the monthly marketData partitions ahead of the incoming data. A failure is only
+            # logged: the partitions are created PARTITION_MONTHS_AHEAD months in advance, so it can wait for the next
+            # day.
+            if partitions_check_date != datetime.datetime.utcnow().date():
+                partitions_check_date = datetime.datetime.utcnow().date()
+                try:
+                    data_puller_schema.ensure_market_data_partitions(con)
+                except Exception as inst:
+                    logger.error("Unable to add the marketData partitions. Next try tomorrow")
+                    logger.error(type(inst))
+                    logger.error(inst.args)
+                    logger.error(traceback.format_exc())
             if count % LATENCY_MULTIPLYING_FACTOR_EVENTS == 0:
                 # New markets_ids can be added to the loop only if there is some place left regarding the API
                 # limitations.
@@ -10,6 +10,7 @@ from data_puller_logger import logger
 import credentials
 from time import sleep
 from sqlalchemy import create_engine
+from sqlalchemy.dialects.mysql import insert
 import traceback
 
 
@@ -35,3 +36,12 @@ while True:
         logger.error(traceback.format_exc())
         sleep(WAIT_TIME)
 
+
+def insert_skip_duplicates(pd_table, conn, keys, data_iter):
+    """
+    Insertion method for DataFrame.to_sql, skipping the rows whose primary key is already stored (e.g. runner names
+    seen in previous markets, or a write_data retried after a partial failure) instead of failing. Unlike INSERT IGNORE,
+    the no-op ON DUPLICATE KEY UPDATE still raises on invalid data (NULL keys, truncated values).
+    """
+    statement = insert(pd_table.table).on_duplicate_key_update({keys[0]: pd_table.table.c[keys[0]]})
+    conn.execute(statement, [dict(zip(keys, row)) for row in data_iter])
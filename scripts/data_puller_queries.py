@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 19 2026
+
+Common read access paths on the mysql database, written to be served by the indexes of data_puller_schema.
+"""
+
+import pandas as pd
+from sqlalchemy import text
+
+
+def _date_range_clause(params, start, end):
+    """Adds the optional Date bounds to the query params, the partitions outside of them are pruned by mysql."""
+    clause = ''
+    if start is not None:
+        clause += ' AND Date >= :start'
+        params['start'] = start
+    if end is not None:
+        clause += ' AND Date < :end'
+        params['end'] = end
+    return clause
+
+
+def market_time_series(con, market_id, selection_id=None, start=None, end=None):
+    """
+    Returns the prices of one market over time, read through the (MarketID, SelectionID, Date) primary key.
+    marketData is partitioned by month on Date: without start/end the key is searched in every partition, so callers
+    knowing when the market ran (e.g. its start time) should pass the bounds.
+    :param con: The mysql connection.
+    :param market_id: string, the Betfair market id (e.g. '1.170226960').
+    :param selection_id: int, restricts the series to one runner.
+    :param start: datetime, first date included.
+    :param end: datetime, first date excluded.
+    :return: A DataFrame ordered by SelectionID and Date.
+    """
+    params = {'market_id': market_id}
+    query = "SELECT * FROM marketData WHERE MarketID = :market_id"
+    if selection_id is not None:
+        query += " AND SelectionID = :selection_id"
+        params['selection_id'] = selection_id
+    query += _date_range_clause(params, start, end) + " ORDER BY SelectionID, Date"
+    return pd.read_sql(text(query), con, params=params)
+
+
+def last_prices(con, market_id, start=None, end=None):
+    """
+    Returns the last snapshot of a market, one line per runner. The last date is read through the (MarketID, Date)
+    index; as for market_time_series, start/end restrict the search to the partitions of the dates the market ran.
+    :param con: The mysql connection.
+    :param market_id: string, the Betfair market id.
+    :param start: datetime, first date included.
+    :param end: datetime, first date excluded.
+    :return:
+    """
+    params = {'market_id': market_id}
+    date_range_clause = _date_range_clause(params, start, end)
+    query = """
+        SELECT * FROM marketData
+        WHERE MarketID = :market_id{0}
+          AND Date = (SELECT MAX(Date) FROM marketData WHERE MarketID = :market_id{0})
+        ORDER BY SelectionID
+    """.format(date_range_clause)
+    return pd.read_sql(text(query), con, params=params)
+
+
+def runner_time_series(con, selection_id, start=None, end=None):
+    """
+    Returns the prices of one runner over all its markets, read through the (SelectionID, Date) index.
+    :param con: The mysql connection.
+    :param selection_id: int, the Betfair selection id of the runner.
+    :param start: datetime, first date included.
+    :param end: datetime, first date excluded.
+    :return: A DataFrame ordered by Date.
+    """
+    params = {'selection_id': selection_id}
+    query = "SELECT * FROM marketData WHERE SelectionID = :selection_id"
+    query += _date_range_clause(params, start, end) + " ORDER BY Date"
+    return pd.read_sql(text(query), con, params=params)
+
+
+def competition_results(con, competition_id):
+    """
+    Returns the results of all the markets of a competition, with the name of the winners.
+    :param con: The mysql connection.
+    :param competition_id: int, the Betfair competition id.
+    :return: A DataFrame ordered by MarketID.
+    """
+    query = """
+        SELECT i.MarketID, i.CountryCode, i.CompetitionName, r.WinnerSelectionID, n.RunnerNames AS WinnerName
+        FROM marketInfo i
+        JOIN results r ON r.MarketID = i.MarketID
+        LEFT JOIN runnerNames n ON n.SelectionID = r.WinnerSelectionID
+        WHERE i.CompetitionID = :competition_id
+        ORDER BY i.MarketID
+    """
+    return pd.read_sql(text(query), con, params={'competition_id': competition_id})
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 19 2026
+"""
+
+import datetime
+import logging
+from sqlalchemy import text
+
+# Same logger as data_puller_logger, fetched by name so that importing this module (e.g. from the benchmark) does not
+# reset the log file of a running data puller.
+logger = logging.getLogger('betfair_data_logger')
+
+# ------ CONSTANT VARIABLES -------
+SCHEMA_VERSION_TABLE = 'schemaVersion'
+LEGACY_SUFFIX = 'Legacy'
+PARTITION_MONTHS_AHEAD = 3
+DRAW_SELECTION_ID = 58805
+DRAW_RUNNER_NAME = 'The Draw'
+
+# Column names are kept identical to the ones previously created by DataFrame.to_sql (spaces stripped), so that the
+# writing code and any existing query keep working.
+MARKET_DATA_COLUMNS = """
+    SelectionID INT UNSIGNED NOT NULL,
+    BackPrice1 DECIMAL(6, 2),
+    BackSize1 DECIMAL(12, 2),
+    BackPrice2 DECIMAL(6, 2),
+    BackSize2 DECIMAL(12, 2),
+    BackPrice3 DECIMAL(6, 2),
+    BackSize3 DECIMAL(12, 2),
+    LayPrice1 DECIMAL(6, 2),
+    LaySize1 DECIMAL(12, 2),
+    LayPrice2 DECIMAL(6, 2),
+    LaySize2 DECIMAL(12, 2),
+    LayPrice3 DECIMAL(6, 2),
+    LaySize3 DECIMAL(12, 2),
+    LastPriceTraded DECIMAL(6, 2),
+    MarketStatus VARCHAR(16),
+    InPlay BOOLEAN,
+    MarketID VARCHAR(16) NOT NULL,
+    Date DATETIME NOT NULL,
+    PRIMARY KEY (MarketID, SelectionID, Date),
+    KEY MarketDate (MarketID, Date),
+    KEY SelectionDate (SelectionID, Date)
+"""
+
+TABLES = {
+    'marketInfo': """
+        CREATE TABLE IF NOT EXISTS marketInfo (
+            MarketID VARCHAR(16) NOT NULL,
+            CountryCode CHAR(2),
+            CompetitionName VARCHAR(255),
+            CompetitionID INT UNSIGNED,
+            PRIMARY KEY (MarketID),
+            KEY CompetitionID (CompetitionID),
+            KEY CountryCode (CountryCode)
+        ) ENGINE=InnoDB
+    """,
+    'results': """
+        CREATE TABLE IF NOT EXISTS results (
+            MarketID VARCHAR(16) NOT NULL,
+            WinnerSelectionID INT UNSIGNED NOT NULL,
+            PRIMARY KEY (MarketID),
+            KEY WinnerSelectionID (WinnerSelectionID)
+        ) ENGINE=InnoDB
+    """,
+    'runnerNames': """
+        CREATE TABLE IF NOT EXISTS runnerNames (
+            SelectionID INT UNSIGNED NOT NULL,
+            RunnerNames VARCHAR(255),
+            PRIMARY KEY (SelectionID)
+        ) ENGINE=InnoDB
+    """,
+}
+
+# SELECT expressions used to copy the rows of the tables auto-created by DataFrame.to_sql (DOUBLE ids, TEXT strings)
+# into the typed tables. Rows missing a primary key column are dropped. The no-op ON DUPLICATE KEY UPDATE skips the
+# duplicates, which also makes re-running an interrupted copy safe. Unlike INSERT IGNORE, it does not silently convert
+# a legacy value that does not fit its typed column: _copy_legacy_rows raises on any warning.
+LEGACY_COPIES = {
+    'marketData': """
+        INSERT INTO marketData (
+               SelectionID,
+               BackPrice1, BackSize1, BackPrice2, BackSize2, BackPrice3, BackSize3,
+               LayPrice1, LaySize1, LayPrice2, LaySize2, LayPrice3, LaySize3,
+               LastPriceTraded, MarketStatus, InPlay, MarketID, Date
+        )
+        SELECT CAST(ROUND(SelectionID) AS UNSIGNED),
+               BackPrice1, BackSize1, BackPrice2, BackSize2, BackPrice3, BackSize3,
+               LayPrice1, LaySize1, LayPrice2, LaySize2, LayPrice3, LaySize3,
+               LastPriceTraded, MarketStatus, InPlay, MarketID, CAST(Date AS DATETIME)
+        FROM marketDataLegacy
+        WHERE MarketID IS NOT NULL AND SelectionID IS NOT NULL AND Date >= :start AND Date < :end
+        ON DUPLICATE KEY UPDATE marketData.MarketID = marketData.MarketID
+    """,
+    'marketInfo': """
+        INSERT INTO marketInfo (MarketID, CountryCode, CompetitionName, CompetitionID)
+        SELECT MarketID, CountryCode, CompetitionName, CAST(CompetitionID AS UNSIGNED)
+        FROM marketInfoLegacy
+        WHERE MarketID IS NOT NULL
+        ON DUPLICATE KEY UPDATE marketInfo.MarketID = marketInfo.MarketID
+    """,
+    'results': """
+        INSERT INTO results (MarketID, WinnerSelectionID)
+        SELECT MarketID, CAST(ROUND(WinnerSelectionID) AS UNSIGNED)
+        FROM resultsLegacy
+        WHERE MarketID IS NOT NULL AND WinnerSelectionID IS NOT NULL
+        ON DUPLICATE KEY UPDATE results.MarketID = results.MarketID
+    """,
+    'runnerNames': """
+        INSERT INTO runnerNames (SelectionID, RunnerNames)
+        SELECT CAST(ROUND(SelectionID) AS UNSIGNED), RunnerNames
+        FROM runnerNamesLegacy
+        WHERE SelectionID IS NOT NULL
+        ON DUPLICATE KEY UPDATE runnerNames.SelectionID = runnerNames.SelectionID
+    """,
+}
+
+
+def _month_start(date):
+    return datetime.datetime(date.year, date.month, 1)
+
+
+def _next_month(date):
+    return datetime.datetime(date.year + date.month // 12, date.month % 12 + 1, 1)
+
+
+def _partition_name(month):
+    return 'p{:%Y%m}'.format(month)
+
+
+def _partitions_definition(first_month, last_month):
+    """
+    Returns the monthly RANGE COLUMNS partitions from first_month to last_month (included), followed by the pMax
+    catch-all partition.
+    """
+    partitions = []
+    month = _month_start(first_month)
+    while month <= last_month:
+        partitions.append("PARTITION {} VALUES LESS THAN ('{:%Y-%m-%d}')".format(_partition_name(month),
+                                                                                _next_month(month)))
+        month = _next_month(month)
+    partitions.append('PARTITION pMax VALUES LESS THAN (MAXVALUE)')
+    return ',\n'.join(partitions)
+
+
+def _table_exists(con, table_name):
+    return con.execute(
+        text("SELECT COUNT(*) FROM information_schema.TABLES "
+             "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name"),
+        {'table_name': table_name}
+    ).scalar() > 0
+
+
+def _has_primary_key(con, table_name):
+    """The tables auto-created by DataFrame.to_sql have no primary key, all the typed ones have one."""
+    return con.execute(
+        text("SELECT COUNT(*) FROM information_schema.TABLE_CONSTRAINTS "
+             "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name AND CONSTRAINT_TYPE = 'PRIMARY KEY'"),
+        {'table_name': table_name}
+    ).scalar() > 0
+
+
+def _target_month(months_ahead):
+    month = _month_start(datetime.datetime.utcnow())
+    for _ in range(months_ahead):
+        month = _next_month(month)
+    return month
+
+
+def create_market_data_table(con, first_month, months_ahead=PARTITION_MONTHS_AHEAD):
+    """
+    Creates the marketData table, range partitioned by month on the Date column. The partitions go from first_month
+    to months_ahead months after the current one; later rows land in pMax until ensure_market_data_partitions is run.
+    :param con: The mysql connection.
+    :param first_month: datetime of the oldest row that will be stored.
+    :param months_ahead: Number of months to pre-create after the current one.
+    :return:
+    """
+    con.execute(text(
+        "CREATE TABLE IF NOT EXISTS marketData ({}) ENGINE=InnoDB\nPARTITION BY RANGE COLUMNS(Date) (\n{}\n)".format(
+            MARKET_DATA_COLUMNS, _partitions_definition(first_month, _target_month(months_ahead)))
+    ))
+
+
+def ensure_market_data_partitions(con, months_ahead=PARTITION_MONTHS_AHEAD):
+    """
+    Splits the pMax partition of marketData so that monthly partitions exist up to months_ahead months after the
+    current one. Cheap as long as pMax is empty, so it is run by the data puller once a day.
+    :param con: The mysql connection.
+    :param months_ahead: Number of months to pre-create after the current one.
+    :return:
+    """
+    partition_names = [row[0] for row in con.execute(
+        text("SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+             "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'marketData' AND PARTITION_NAME <> 'pMax'")
+    )]
+    if not partition_names:
+        logger.warning("marketData is not partitioned, no partition has been added. Run data_puller_schema.py to "
+                       "migrate the database")
+        return
+
+    first_missing_month = _next_month(datetime.datetime.strptime(max(partition_names), 'p%Y%m'))
+    target_month = _target_month(months_ahead)
+    if first_missing_month > target_month:
+        return
+
+    con.execute(text("ALTER TABLE marketData REORGANIZE PARTITION pMax INTO (\n{}\n)".format(
+        _partitions_definition(first_missing_month, target_month))))
+    logger.info("marketData partitions added from {:%Y-%m} to {:%Y-%m}".format(first_missing_month, target_month))
+
+
+def _copy_legacy_rows(con, table_name, params=None):
+    """
+    Runs the LEGACY_COPIES statement of table_name. Raises if mysql reported any warning, i.e. a legacy value converted
+    to fit its typed column, so that no row is altered without notice.
+    :return: The number of rows affected.
+    """
+    copied = con.execute(text(LEGACY_COPIES[table_name]), params or {}).rowcount
+    warnings_count = con.execute(text("SHOW COUNT(*) WARNINGS")).scalar()
+    if warnings_count:
+        warnings = [tuple(row) for row in con.execute(text("SHOW WARNINGS LIMIT 10"))]
+        raise ValueError("{} warnings while copying {} to {}, first ones: {}. Fix the legacy rows and run the "
+                         "migration again".format(warnings_count, table_name + LEGACY_SUFFIX, table_name, warnings))
+    return copied
+
+
+def _migrate_market_data(con):
+    """
+    Creates the partitioned marketData table and copies marketDataLegacy into it one month at a time, matching the
+    partitions, so that each statement (and its undo log) stays bounded and the progress is logged.
+    """
+    first_date, last_date = None, None
+    if _table_exists(con, 'marketDataLegacy'):
+        first_date, last_date = con.execute(
+            text("SELECT MIN(CAST(Date AS DATETIME)), MAX(CAST(Date AS DATETIME)) FROM marketDataLegacy")
+        ).fetchone()
+    create_market_data_table(con, first_date or datetime.datetime.utcnow())
+    if first_date is None:
+        return
+
+    # Without this index, every monthly chunk would scan the whole legacy table
+    has_date_index = con.execute(
+        text("SELECT COUNT(*) FROM information_schema.STATISTICS "
+             "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'marketDataLegacy' AND INDEX_NAME = 'LegacyDate'")
+    ).scalar() > 0
+    if not has_date_index:
+        logger.info("Indexing marketDataLegacy on Date before copying it")
+        con.execute(text("ALTER TABLE marketDataLegacy ADD INDEX LegacyDate (Date)"))
+
+    month = _month_start(first_date)
+    while month <= last_date:
+        copied = _copy_legacy_rows(con, 'marketData', {'start': month, 'end': _next_month(month)})
+        logger.info("{} rows copied from marketDataLegacy to marketData for {:%Y-%m}".format(copied, month))
+        month = _next_month(month)
+
+
+def _migrate_typed_tables(con):
+    """
+    Migration 1: replaces the tables auto-created by DataFrame.to_sql with typed, indexed tables, marketData being
+    partitioned by month. The previous tables are renamed with the LEGACY_SUFFIX and kept until dropped manually.
+    """
+    for table_name in ['marketData'] + list(TABLES):
+        legacy_name = table_name + LEGACY_SUFFIX
+        # Only the untyped tables are renamed: a typed table (e.g. created by an interrupted run on a fresh install)
+        # or an existing legacy table (an interrupted run on an existing install) means this step is already done.
+        if _table_exists(con, table_name) and not _has_primary_key(con, table_name) and \
+                not _table_exists(con, legacy_name):
+            con.execute(text("RENAME TABLE {} TO {}".format(table_name, legacy_name)))
+
+        if table_name == 'marketData':
+            _migrate_market_data(con)
+            continue
+
+        con.execute(text(TABLES[table_name]))
+        if _table_exists(con, legacy_name):
+            copied = _copy_legacy_rows(con, table_name)
+            logger.info("{} rows copied from {} to {}".format(copied, legacy_name, table_name))
+
+    # The draw is filtered out of the runner names pulled from the API, but is a possible winner of any market
+    con.execute(text("INSERT INTO runnerNames (SelectionID, RunnerNames) VALUES (:selection_id, :runner_name) "
+                     "ON DUPLICATE KEY UPDATE SelectionID = SelectionID"),
+                {'selection_id': DRAW_SELECTION_ID, 'runner_name': DRAW_RUNNER_NAME})
+
+
+MIGRATIONS = [
+    (1, _migrate_typed_tables),
+]
+
+
+def migrate(con):
+    """
+    Applies the migrations that have not been applied yet on the database, then makes sure the marketData partitions
+    cover the months to come.
+    :param con: The mysql connection.
+    :return:
+    """
+    con.execute(text("CREATE TABLE IF NOT EXISTS {} ("
+                     "Version INT UNSIGNED NOT NULL PRIMARY KEY, "
+                     "AppliedAt DATETIME NOT NULL"
+                     ") ENGINE=InnoDB".format(SCHEMA_VERSION_TABLE)))
+    current_version = con.execute(
+        text("SELECT COALESCE(MAX(Version), 0) FROM {}".format(SCHEMA_VERSION_TABLE))
+    ).scalar()
+
+    for version, migration in MIGRATIONS:
+        if version <= current_version:
+            continue
+        logger.info("Applying mysql schema migration {}".format(version))
+        migration(con)
+        con.execute(text("INSERT INTO {} VALUES (:version, :applied_at)".format(SCHEMA_VERSION_TABLE)),
+                    {'version': version, 'applied_at': datetime.datetime.utcnow().replace(microsecond=0)})
+
+    ensure_market_data_partitions(con)
+
+
+if __name__ == "__main__":
+    # The migration renames and copies the production tables: run it with the data puller stopped, after running
+    # benchmark_mysql_schema.py against the same mysql server version.
+    from data_puller_mysql import con
+    migrate(con)